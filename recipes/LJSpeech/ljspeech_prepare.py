@@ -9,10 +9,13 @@ Authors
 """
 
 import csv
+import functools
 import json
+import multiprocessing
 import os
-import random
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
 
 import numpy as np
 import tgt
@@ -25,19 +28,25 @@ from speechbrain.dataio.dataio import load_pkl, save_pkl
 from speechbrain.inference.text import GraphemeToPhoneme
 from speechbrain.utils.data_utils import download_file
 from speechbrain.utils.logger import get_logger
+from speechbrain.utils.parallel import parallel_map
 from speechbrain.utils.text_to_sequence import _g2p_keep_punctuations
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 OPT_FILE = "opt_ljspeech_prepare.pkl"
 METADATA_CSV = "metadata.csv"
+METADATA_CACHE = "metadata_ljspeech.pkl"
+METADATA_CACHE_VERSION = 1
 TRAIN_JSON = "train.json"
 VALID_JSON = "valid.json"
 TEST_JSON = "test.json"
 WAVS = "wavs"
 DURATIONS = "durations"
-
-logger = get_logger(__name__)
-OPT_FILE = "opt_ljspeech_prepare.pkl"
+G2P_MODELS = ["Tacotron2", "FastSpeech2WithAlignment"]
 
 
 def prepare_ljspeech(
@@ -101,9 +110,6 @@ def prepare_ljspeech(
     >>> seed = 1234
     >>> prepare_ljspeech(data_folder, save_folder, splits, split_ratio, seed)
     """
-    # Sets seeds for reproducible code
-    random.seed(seed)
-
     if skip_prep:
         return
 
@@ -115,8 +121,7 @@ def prepare_ljspeech(
         "save_folder": save_folder,
         "seed": seed,
     }
-    if not os.path.exists(save_folder):
-        os.makedirs(save_folder)
+    os.makedirs(save_folder, exist_ok=True)
 
     # Setting output files
     meta_csv = os.path.join(data_folder, METADATA_CSV)
@@ -146,13 +151,11 @@ def prepare_ljspeech(
         )
 
         duration_folder = os.path.join(data_folder, "durations")
-        if not os.path.exists(duration_folder):
-            os.makedirs(duration_folder)
+        os.makedirs(duration_folder, exist_ok=True)
 
         # extract pitch for both Fastspeech2 and FastSpeech2WithAligner models
         pitch_folder = os.path.join(data_folder, "pitch")
-        if not os.path.exists(pitch_folder):
-            os.makedirs(pitch_folder)
+        os.makedirs(pitch_folder, exist_ok=True)
 
     # Check if this phase is already done (if so, skip it)
     if skip(splits, save_folder, conf):
@@ -166,59 +169,53 @@ def prepare_ljspeech(
     # Prepare data splits
     msg = "Creating json file for ljspeech Dataset.."
     logger.info(msg)
-    data_split, meta_csv = split_sets(data_folder, splits, split_ratio)
-
-    if "train" in splits:
-        prepare_json(
-            model_name,
-            data_split["train"],
-            save_json_train,
-            wavs_folder,
-            meta_csv,
-            phoneme_alignments_folder,
-            duration_folder,
-            pitch_folder,
-            pitch_n_fft,
-            pitch_hop_length,
-            pitch_min_f0,
-            pitch_max_f0,
-            use_custom_cleaner,
-            device,
-        )
-    if "valid" in splits:
-        prepare_json(
-            model_name,
-            data_split["valid"],
-            save_json_valid,
-            wavs_folder,
-            meta_csv,
-            phoneme_alignments_folder,
-            duration_folder,
-            pitch_folder,
-            pitch_n_fft,
-            pitch_hop_length,
-            pitch_min_f0,
-            pitch_max_f0,
-            use_custom_cleaner,
-            device,
-        )
-    if "test" in splits:
-        prepare_json(
-            model_name,
-            data_split["test"],
-            save_json_test,
-            wavs_folder,
-            meta_csv,
-            phoneme_alignments_folder,
-            duration_folder,
-            pitch_folder,
-            pitch_n_fft,
-            pitch_hop_length,
-            pitch_min_f0,
-            pitch_max_f0,
-            use_custom_cleaner,
-            device,
-        )
+    data_split, meta_rows = split_sets(
+        data_folder, splits, split_ratio, seed, save_folder
+    )
+
+    split_json = {
+        "train": save_json_train,
+        "valid": save_json_valid,
+        "test": save_json_test,
+    }
+    jobs = [
+        (data_split[split], split_json[split])
+        for split in split_json
+        if split in splits
+    ]
+    split_processor = functools.partial(
+        _prepare_split,
+        model_name=model_name,
+        wavs_folder=wavs_folder,
+        meta_rows=meta_rows,
+        phoneme_alignments_folder=phoneme_alignments_folder,
+        durations_folder=duration_folder,
+        pitch_folder=pitch_folder,
+        pitch_n_fft=pitch_n_fft,
+        pitch_hop_length=pitch_hop_length,
+        pitch_min_f0=pitch_min_f0,
+        pitch_max_f0=pitch_max_f0,
+        use_custom_cleaner=use_custom_cleaner,
+        device=device,
+    )
+    if model_name == "FastSpeech2" and len(jobs) > 1:
+        # Per-utterance audio processing dominates, so the independent splits
+        # are prepared in parallel. Workers are spawned rather than forked, as
+        # torch thread pools may already exist in this process.
+        with ProcessPoolExecutor(
+            max_workers=len(jobs),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            for _ in parallel_map(
+                functools.partial(split_processor, progress_bar=False),
+                jobs,
+                chunk_size=1,
+                executor=executor,
+            ):
+                pass
+    else:
+        for job in jobs:
+            split_processor(job)
     save_pkl(conf, save_opt)
 
 
@@ -242,34 +239,87 @@ def skip(splits, save_folder, conf):
         if True, the preparation phase can be skipped.
         if False, it must be done.
     """
-    # Checking json files
-    skip = True
-
     split_files = {
         "train": TRAIN_JSON,
         "valid": VALID_JSON,
         "test": TEST_JSON,
     }
 
+    # Checking that the saved options and json files exist
+    save_opt = os.path.join(save_folder, OPT_FILE)
+    if not os.path.isfile(save_opt):
+        return False
     for split in splits:
         if not os.path.isfile(os.path.join(save_folder, split_files[split])):
-            skip = False
+            return False
 
-    #  Checking saved options
-    save_opt = os.path.join(save_folder, OPT_FILE)
-    if skip is True:
-        if os.path.isfile(save_opt):
-            opts_old = load_pkl(save_opt)
-            if opts_old == conf:
-                skip = True
-            else:
-                skip = False
-        else:
-            skip = False
-    return skip
+    # Checking saved options, only once all the files are there
+    return load_pkl(save_opt) == conf
+
+
+def load_metadata(meta_csv, cache_file=None):
+    """Parses the LJspeech metadata and groups the utterances by session.
+    If a cache file is given, the parsed metadata is stored there and reused
+    as long as it was written from the same csv file, with the same size and
+    modification time, by the same version of the cache format.
+
+    Arguments
+    ---------
+    meta_csv : str
+        Path to the LJspeech metadata.csv file.
+    cache_file : str
+        Path to the pickle file used to cache the parsed metadata.
+
+    Returns
+    -------
+    meta_rows : list
+        The parsed csv rows.
+    session_bounds : list
+        For each session, the (start, stop) range of its rows in meta_rows.
+    """
+    cache_key = {
+        "version": METADATA_CACHE_VERSION,
+        "path": os.path.abspath(meta_csv),
+        "mtime": os.path.getmtime(meta_csv),
+        "size": os.path.getsize(meta_csv),
+    }
 
+    # Reusing the cached metadata if the csv file did not change
+    if cache_file is not None and os.path.isfile(cache_file):
+        cache = load_pkl(cache_file)
+        if (
+            isinstance(cache, dict)
+            and all(cache.get(key) == value for key, value in cache_key.items())
+            and "rows" in cache
+            and "session_bounds" in cache
+        ):
+            return cache["rows"], cache["session_bounds"]
+
+    with open(
+        meta_csv, newline="", encoding="utf-8", buffering=1 << 20
+    ) as csv_f:
+        csv_reader = csv.reader(csv_f, delimiter="|", quoting=csv.QUOTE_NONE)
+
+        # Rows of the same session (the "LJxxx" id prefix) are contiguous,
+        # so they are grouped while reading the csv, in a single pass.
+        # Every session is kept, including a trailing single-row one.
+        meta_rows = []
+        session_bounds = []
+        for _, rows in groupby(csv_reader, key=lambda row: row[0][:5]):
+            start = len(meta_rows)
+            meta_rows.extend(rows)
+            session_bounds.append((start, len(meta_rows)))
+
+    if cache_file is not None:
+        save_pkl(
+            dict(cache_key, rows=meta_rows, session_bounds=session_bounds),
+            cache_file,
+        )
+
+    return meta_rows, session_bounds
 
-def split_sets(data_folder, splits, split_ratio):
+
+def split_sets(data_folder, splits, split_ratio, seed=1234, save_folder=None):
     """Randomly splits the wav list into training, validation, and test lists.
     Note that a better approach is to make sure that all the classes have the
     same proportion of samples for each session.
@@ -285,59 +335,71 @@ def split_sets(data_folder, splits, split_ratio):
         valid, and test sets, respectively.
         For instance split_ratio=[80, 10, 10] will assign 80% of the sentences
         to training, 10% for validation, and 10% for test.
+    seed : int
+        Seed of the random generator used to shuffle the sessions.
+    save_folder : str
+        If given, the parsed metadata is cached in this directory.
 
     Returns
     -------
     dictionary containing train, valid, and test splits.
     """
     meta_csv = os.path.join(data_folder, METADATA_CSV)
-    csv_reader = csv.reader(
-        open(meta_csv, newline="", encoding="utf-8"),
-        delimiter="|",
-        quoting=csv.QUOTE_NONE,
-    )
+    cache_file = None
+    if save_folder is not None:
+        cache_file = os.path.join(save_folder, METADATA_CACHE)
 
-    meta_csv = list(csv_reader)
-
-    index_for_sessions = []
-    session_id_start = "LJ001"
-    index_this_session = []
-    for i in range(len(meta_csv)):
-        session_id = meta_csv[i][0].split("-")[0]
-        if session_id == session_id_start:
-            index_this_session.append(i)
-            if i == len(meta_csv) - 1:
-                index_for_sessions.append(index_this_session)
-        else:
-            index_for_sessions.append(index_this_session)
-            session_id_start = session_id
-            index_this_session = [i]
+    meta_rows, session_bounds = load_metadata(meta_csv, cache_file)
 
+    # Shuffles the row indexes of each session
+    rng = np.random.default_rng(seed)
+    index_for_sessions = [
+        start + rng.permutation(stop - start) for start, stop in session_bounds
+    ]
     session_len = [len(session) for session in index_for_sessions]
 
+    # Each split takes the next chunk of every shuffled session
+    total_ratio = sum(split_ratio)
+    offsets = [0] * len(index_for_sessions)
     data_split = {}
     for i, split in enumerate(splits):
-        data_split[split] = []
-        for j in range(len(index_for_sessions)):
-            if split == "train":
-                random.shuffle(index_for_sessions[j])
-                n_snts = int(session_len[j] * split_ratio[i] / sum(split_ratio))
-                data_split[split].extend(index_for_sessions[j][0:n_snts])
-                del index_for_sessions[j][0:n_snts]
-            if split == "valid":
-                if "test" in splits:
-                    random.shuffle(index_for_sessions[j])
-                    n_snts = int(
-                        session_len[j] * split_ratio[i] / sum(split_ratio)
-                    )
-                    data_split[split].extend(index_for_sessions[j][0:n_snts])
-                    del index_for_sessions[j][0:n_snts]
-                else:
-                    data_split[split].extend(index_for_sessions[j])
-            if split == "test":
-                data_split[split].extend(index_for_sessions[j])
-
-    return data_split, meta_csv
+        chunks = []
+        for j, session in enumerate(index_for_sessions):
+            start = offsets[j]
+            if split == "test" or (split == "valid" and "test" not in splits):
+                stop = session_len[j]
+            else:
+                stop = start + int(
+                    session_len[j] * split_ratio[i] // total_ratio
+                )
+            chunks.append((start, stop))
+            offsets[j] = stop
+
+        # Allocates the split once and fills it chunk by chunk
+        split_index = np.empty(
+            sum(stop - start for start, stop in chunks), dtype=np.int64
+        )
+        pos = 0
+        for session, (start, stop) in zip(index_for_sessions, chunks):
+            split_index[pos : pos + stop - start] = session[start:stop]
+            pos += stop - start
+        data_split[split] = split_index.tolist()
+
+    return data_split, meta_rows
+
+
+def _prepare_split(job, **kwargs):
+    """Runs prepare_json on a (seg_lst, json_file) job, as used by parallel_map.
+
+    Arguments
+    ---------
+    job : tuple
+        The list of json indexes of a split and the output json path.
+    **kwargs : dict
+        The remaining arguments of prepare_json.
+    """
+    seg_lst, json_file = job
+    prepare_json(seg_lst=seg_lst, json_file=json_file, **kwargs)
 
 
 def prepare_json(
@@ -345,7 +407,7 @@ def prepare_json(
     seg_lst,
     json_file,
     wavs_folder,
-    csv_reader,
+    meta_rows,
     phoneme_alignments_folder,
     durations_folder,
     pitch_folder,
@@ -355,6 +417,7 @@ def prepare_json(
     pitch_max_f0,
     use_custom_cleaner=False,
     device="cpu",
+    progress_bar=True,
 ):
     """
     Creates json file given a list of indexes.
@@ -369,8 +432,8 @@ def prepare_json(
         Output json path
     wavs_folder : str
         LJspeech wavs folder
-    csv_reader : _csv.reader
-        LJspeech metadata
+    meta_rows : list
+        LJspeech metadata, as the list of parsed csv rows
     phoneme_alignments_folder : path
         Path where the phoneme alignments are stored
     durations_folder : path
@@ -389,10 +452,12 @@ def prepare_json(
         If True, uses custom cleaner defined for this recipe
     device : str
         Device for to be used for computation (used as required)
+    progress_bar : bool
+        If True, displays the progress over the utterances with tqdm
     """
 
     logger.info(f"preparing {json_file}.")
-    if model_name in ["Tacotron2", "FastSpeech2WithAlignment"]:
+    if model_name in G2P_MODELS:
         logger.info(
             "Computing phonemes for LJSpeech labels using SpeechBrain G2P. This may take a while."
         )
@@ -404,121 +469,85 @@ def prepare_json(
             "Computing pitch as required for FastSpeech2. This may take a while."
         )
 
-    json_dict = {}
-    for index in tqdm(seg_lst):
-        # Common data preparation
-        id = list(csv_reader)[index][0]
-        wav = os.path.join(wavs_folder, f"{id}.wav")
-        label = list(csv_reader)[index][2]
-        if use_custom_cleaner:
-            label = custom_clean(label, model_name)
-
-        json_dict[id] = {
-            "uttid": id,
-            "wav": wav,
-            "label": label,
-            "segment": True if "train" in json_file else False,
-        }
-
-        # FastSpeech2 specific data preparation
-        if model_name == "FastSpeech2":
-            audio, fs = torchaudio.load(wav)
-
-            # Parses phoneme alignments
-            textgrid_path = os.path.join(
-                phoneme_alignments_folder, f"{id}.TextGrid"
-            )
-            textgrid = tgt.io.read_textgrid(
-                textgrid_path, include_empty_intervals=True
-            )
-
-            last_phoneme_flags = get_last_phoneme_info(
-                textgrid.get_tier_by_name("words"),
-                textgrid.get_tier_by_name("phones"),
-            )
-            (
-                phonemes,
-                duration,
-                start,
-                end,
-                trimmed_last_phoneme_flags,
-            ) = get_alignment(
-                textgrid.get_tier_by_name("phones"),
-                fs,
-                pitch_hop_length,
-                last_phoneme_flags,
-            )
-
-            # Gets label phonemes
-            label_phoneme = " ".join(phonemes)
-            spn_labels = [0] * len(phonemes)
-            for i in range(1, len(phonemes)):
-                if phonemes[i] == "spn":
-                    spn_labels[i - 1] = 1
-            if start >= end:
-                print(f"Skipping {id}")
-                continue
-
-            # Saves durations
-            duration_file_path = os.path.join(durations_folder, f"{id}.npy")
-            np.save(duration_file_path, duration)
-
-            # Computes pitch
-            audio = audio[:, int(fs * start) : int(fs * end)]
-            pitch_file = wav.replace(".wav", ".npy").replace(
-                wavs_folder, pitch_folder
-            )
-            if not os.path.isfile(pitch_file):
-                pitch = torchaudio.functional.detect_pitch_frequency(
-                    waveform=audio,
-                    sample_rate=fs,
-                    frame_time=(pitch_hop_length / fs),
-                    win_length=3,
-                    freq_low=pitch_min_f0,
-                    freq_high=pitch_max_f0,
-                ).squeeze(0)
-
-                # Concatenate last element to match duration.
-                pitch = torch.cat([pitch, pitch[-1].unsqueeze(0)])
-
-                # Mean and Variance Normalization
-                mean = 256.1732939688805
-                std = 328.319759158607
-
-                pitch = (pitch - mean) / std
-
-                pitch = pitch[: sum(duration)]
-                np.save(pitch_file, pitch)
-
-            # Updates data for the utterance
-            json_dict[id].update({"label_phoneme": label_phoneme})
-            json_dict[id].update({"spn_labels": spn_labels})
-            json_dict[id].update({"start": start})
-            json_dict[id].update({"end": end})
-            json_dict[id].update({"durations": duration_file_path})
-            json_dict[id].update({"pitch": pitch_file})
-            json_dict[id].update(
-                {"last_phoneme_flags": trimmed_last_phoneme_flags}
-            )
-
-        # FastSpeech2WithAlignment specific data preparation
-        if model_name == "FastSpeech2WithAlignment":
-            audio, fs = torchaudio.load(wav)
-            # Computes pitch
-            pitch_file = wav.replace(".wav", ".npy").replace(
-                wavs_folder, pitch_folder
-            )
-            if not os.path.isfile(pitch_file):
-                if torchaudio.__version__ < "2.1":
-                    pitch = torchaudio.functional.compute_kaldi_pitch(
-                        waveform=audio,
-                        sample_rate=fs,
-                        frame_length=(pitch_n_fft / fs * 1000),
-                        frame_shift=(pitch_hop_length / fs * 1000),
-                        min_f0=pitch_min_f0,
-                        max_f0=pitch_max_f0,
-                    )[0, :, 0]
-                else:
+    # Only training utterances are randomly segmented
+    is_train = "train" in json_file
+
+    # Folder prefixes, joined once instead of calling os.path.join per entry
+    wav_prefix = os.path.join(wavs_folder, "")
+    if durations_folder is not None:
+        duration_prefix = os.path.join(durations_folder, "")
+
+    # Streams the entries to a temporary file, one utterance at a time, so
+    # that an interrupted run never leaves a truncated json_file behind
+    tmp_json_file = json_file + ".tmp"
+    with open(tmp_json_file, mode="w", encoding="utf-8") as json_f:
+        json_f.write("{")
+        sep = "\n"
+        for index in tqdm(seg_lst, disable=not progress_bar):
+            # Common data preparation
+            row = meta_rows[index]
+            id = row[0]
+            wav = f"{wav_prefix}{id}.wav"
+            label = row[2]
+            if use_custom_cleaner:
+                label = custom_clean(label, model_name)
+
+            entry = {
+                "uttid": id,
+                "wav": wav,
+                "label": label,
+                "segment": is_train,
+            }
+
+            # FastSpeech2 specific data preparation
+            if model_name == "FastSpeech2":
+                audio, fs = torchaudio.load(wav)
+
+                # Parses phoneme alignments
+                textgrid_path = os.path.join(
+                    phoneme_alignments_folder, f"{id}.TextGrid"
+                )
+                textgrid = tgt.io.read_textgrid(
+                    textgrid_path, include_empty_intervals=True
+                )
+
+                last_phoneme_flags = get_last_phoneme_info(
+                    textgrid.get_tier_by_name("words"),
+                    textgrid.get_tier_by_name("phones"),
+                )
+                (
+                    phonemes,
+                    duration,
+                    start,
+                    end,
+                    trimmed_last_phoneme_flags,
+                ) = get_alignment(
+                    textgrid.get_tier_by_name("phones"),
+                    fs,
+                    pitch_hop_length,
+                    last_phoneme_flags,
+                )
+
+                # Gets label phonemes
+                label_phoneme = " ".join(phonemes)
+                spn_labels = [0] * len(phonemes)
+                for i in range(1, len(phonemes)):
+                    if phonemes[i] == "spn":
+                        spn_labels[i - 1] = 1
+                if start >= end:
+                    print(f"Skipping {id}")
+                    continue
+
+                # Saves durations
+                duration_file_path = f"{duration_prefix}{id}.npy"
+                np.save(duration_file_path, duration)
+
+                # Computes pitch
+                audio = audio[:, int(fs * start) : int(fs * end)]
+                pitch_file = wav.replace(".wav", ".npy").replace(
+                    wavs_folder, pitch_folder
+                )
+                if not os.path.isfile(pitch_file):
                     pitch = torchaudio.functional.detect_pitch_frequency(
                         waveform=audio,
                         sample_rate=fs,
@@ -537,16 +566,75 @@ def prepare_json(
 
                     pitch = (pitch - mean) / std
 
-                np.save(pitch_file, pitch)
-
-            phonemes = _g2p_keep_punctuations(g2p, label)
-            # Updates data for the utterance
-            json_dict[id].update({"phonemes": phonemes})
-            json_dict[id].update({"pitch": pitch_file})
-
-    # Writing the dictionary to the json file
-    with open(json_file, mode="w", encoding="utf-8") as json_f:
-        json.dump(json_dict, json_f, indent=2)
+                    pitch = pitch[: sum(duration)]
+                    np.save(pitch_file, pitch)
+
+                # Updates data for the utterance
+                entry.update({"label_phoneme": label_phoneme})
+                entry.update({"spn_labels": spn_labels})
+                entry.update({"start": start})
+                entry.update({"end": end})
+                entry.update({"durations": duration_file_path})
+                entry.update({"pitch": pitch_file})
+                entry.update({"last_phoneme_flags": trimmed_last_phoneme_flags})
+
+            # FastSpeech2WithAlignment specific data preparation
+            if model_name == "FastSpeech2WithAlignment":
+                audio, fs = torchaudio.load(wav)
+                # Computes pitch
+                pitch_file = wav.replace(".wav", ".npy").replace(
+                    wavs_folder, pitch_folder
+                )
+                if not os.path.isfile(pitch_file):
+                    if torchaudio.__version__ < "2.1":
+                        pitch = torchaudio.functional.compute_kaldi_pitch(
+                            waveform=audio,
+                            sample_rate=fs,
+                            frame_length=(pitch_n_fft / fs * 1000),
+                            frame_shift=(pitch_hop_length / fs * 1000),
+                            min_f0=pitch_min_f0,
+                            max_f0=pitch_max_f0,
+                        )[0, :, 0]
+                    else:
+                        pitch = torchaudio.functional.detect_pitch_frequency(
+                            waveform=audio,
+                            sample_rate=fs,
+                            frame_time=(pitch_hop_length / fs),
+                            win_length=3,
+                            freq_low=pitch_min_f0,
+                            freq_high=pitch_max_f0,
+                        ).squeeze(0)
+
+                        # Concatenate last element to match duration.
+                        pitch = torch.cat([pitch, pitch[-1].unsqueeze(0)])
+
+                        # Mean and Variance Normalization
+                        mean = 256.1732939688805
+                        std = 328.319759158607
+
+                        pitch = (pitch - mean) / std
+
+                    np.save(pitch_file, pitch)
+
+                phonemes = _g2p_keep_punctuations(g2p, label)
+                # Updates data for the utterance
+                entry.update({"phonemes": phonemes})
+                entry.update({"pitch": pitch_file})
+
+            # Same layout as json.dump(..., indent=2, ensure_ascii=False)
+            if orjson is not None:
+                entry_json = orjson.dumps(
+                    entry, option=orjson.OPT_INDENT_2
+                ).decode("utf-8")
+            else:
+                entry_json = json.dumps(entry, indent=2, ensure_ascii=False)
+            entry_json = entry_json.replace("\n", "\n  ")
+            json_f.write(
+                f"{sep}  {json.dumps(id, ensure_ascii=False)}: {entry_json}"
+            )
+            sep = ",\n"
+        json_f.write("}" if sep == "\n" else "\n}")
+    os.replace(tmp_json_file, json_file)
 
     logger.info(f"{json_file} successfully created!")
 